@@ -1,13 +1,16 @@
-from flask import Flask, jsonify, request, render_template_string
+from flask import Flask, Response, jsonify, request, render_template
+import hashlib
 import logging
 import json
 import os
 import time
 from datetime import datetime
 import uuid
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 from werkzeug.exceptions import HTTPException
 
+PROCESS_STARTED_AT = time.time()
+
 app = Flask(__name__)
 
 logging.basicConfig(
@@ -19,6 +22,9 @@ logger = logging.getLogger(__name__)
 
 REQUEST_COUNT = Counter('flask_requests_total', 'Total Flask requests', ['method', 'endpoint', 'status'])
 REQUEST_LATENCY = Histogram('flask_request_duration_seconds', 'Flask request latency', ['method', 'endpoint'])
+STARTUP_IMPORT_SECONDS = Gauge('flask_startup_import_seconds', 'Time spent building the app after its imports')
+STARTUP_READY_SECONDS = Gauge('flask_startup_ready_seconds', 'Time from worker start until it is ready to serve requests')
+STARTUP_FIRST_REQUEST_SECONDS = Gauge('flask_startup_first_request_seconds', 'Time from worker start to its first completed request')
 
 users_db = [
     {"id": 1, "name": "Alice Johnson", "email": "alice@example.com", "role": "admin"},
@@ -26,6 +32,100 @@ users_db = [
     {"id": 3, "name": "Charlie Brown", "email": "charlie@example.com", "role": "user"}
 ]
 
+BUILD_INFO_PATH = '/app/build-info.txt'
+
+def read_build_info_file(path=BUILD_INFO_PATH):
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return "Build info file not found"
+    except Exception as e:
+        return f"Error reading build info: {str(e)}"
+
+class StaticJSONPayload:
+    """JSON payload built and serialized once, served as prebuilt bytes with a strong ETag.
+
+    When watch_path is set, the file's mtime is checked on each request and the
+    payload is rebuilt if it changed.
+    """
+
+    def __init__(self, builder, watch_path=None):
+        self.builder = builder
+        self.watch_path = watch_path
+        self._state = self._build()
+
+    def _mtime(self):
+        try:
+            return os.stat(self.watch_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _build(self):
+        mtime = self._mtime() if self.watch_path else None
+        # Same bytes jsonify would produce, including its sorted keys
+        body = app.json.response(self.builder()).get_data()
+        etag = hashlib.sha256(body).hexdigest()
+        # Single tuple so a concurrent reload is swapped in atomically
+        return mtime, body, etag
+
+    def response(self):
+        if self.watch_path and self._mtime() != self._state[0]:
+            self._state = self._build()
+        _, body, etag = self._state
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        return response.make_conditional(request)
+
+def build_info_payload():
+    return {
+        "service": "flask-app",
+        "build_info": read_build_info_file(),
+        "environment": {
+            "hostname": os.environ.get("HOSTNAME", "unknown"),
+            "build_number": os.environ.get("BUILD_NUMBER", "unknown"),
+            "git_commit": os.environ.get("GIT_COMMIT", "unknown")
+        }
+    }
+
+def health_payload():
+    return {
+        "status": "healthy",
+        "version": "1.0.0",
+        "service": "flask-app"
+    }
+
+# The build info file is written during the Docker build and never changes afterwards;
+# set BUILD_INFO_RELOAD=true to pick up edits to it without restarting
+BUILD_INFO = StaticJSONPayload(
+    build_info_payload,
+    watch_path=BUILD_INFO_PATH if os.environ.get('BUILD_INFO_RELOAD', 'false').lower() == 'true' else None
+)
+HEALTH = StaticJSONPayload(health_payload)
+
+startup_report = {
+    "import_seconds": None,
+    "ready_seconds": None,
+    "first_request_seconds": None
+}
+
+# Start of this worker's cold start: the import itself, or the fork when
+# gunicorn --preload hands the already-imported app to a new worker
+worker_started_at = PROCESS_STARTED_AT
+
+def reset_startup_report():
+    global worker_started_at
+    worker_started_at = time.time()
+    startup_report["ready_seconds"] = None
+    startup_report["first_request_seconds"] = None
+
+os.register_at_fork(after_in_child=reset_startup_report)
+
+def record_worker_ready():
+    """Called once the app can serve, from gunicorn's post_worker_init hook."""
+    startup_report["ready_seconds"] = round(time.time() - worker_started_at, 4)
+    STARTUP_READY_SECONDS.set(startup_report["ready_seconds"])
+
 def log_structured(level, message, **kwargs):
     log_entry = {
         "timestamp": datetime.utcnow().isoformat(),
@@ -58,8 +158,16 @@ def after_request(response):
                    path=request.path,
                    status_code=response.status_code,
                    response_time=round(request_latency * 1000, 2))
+
+    if startup_report["first_request_seconds"] is None:
+        record_first_request()
     return response
 
+def record_first_request():
+    startup_report["first_request_seconds"] = round(time.time() - worker_started_at, 4)
+    STARTUP_FIRST_REQUEST_SECONDS.set(startup_report["first_request_seconds"])
+    log_structured("INFO", "Startup report", pid=os.getpid(), **startup_report)
+
 @app.errorhandler(Exception)
 def handle_exception(e):
     if isinstance(e, HTTPException):
@@ -73,11 +181,8 @@ def handle_exception(e):
                    error_message=str(e))
     return jsonify({"error": "Internal server error", "code": 500}), 500
 
-@app.route('/')
-def home():
-    log_structured("INFO", "Home page accessed")
-    current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-    return render_template_string('''
+# Compiled once at import instead of on every request to '/'
+HOME_TEMPLATE = app.jinja_env.from_string('''
     <!DOCTYPE html>
     <html>
     <head>
@@ -152,46 +257,24 @@ def home():
         </div>
     </body>
     </html>
-    ''', current_time=current_time)
+    ''')
+
+@app.route('/')
+def home():
+    log_structured("INFO", "Home page accessed")
+    current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+    return render_template(HOME_TEMPLATE, current_time=current_time)
 
 @app.route('/health')
 def health():
-    health_status = {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0",
-        "service": "flask-app"
-    }
     log_structured("INFO", "Health check performed", status="healthy")
-    return jsonify(health_status)
+    return HEALTH.response()
 
 @app.route('/build-info')
 def build_info():
     """Endpoint to show build and deployment information"""
-    build_data = {
-        "service": "flask-app",
-        "timestamp": datetime.utcnow().isoformat(),
-        "build_info": "No build info available"
-    }
-    
-    # Try to read build info from file created during Docker build
-    try:
-        with open('/app/build-info.txt', 'r') as f:
-            build_data["build_info"] = f.read().strip()
-    except FileNotFoundError:
-        build_data["build_info"] = "Build info file not found"
-    except Exception as e:
-        build_data["build_info"] = f"Error reading build info: {str(e)}"
-    
-    # Add environment variables that might contain build info
-    build_data["environment"] = {
-        "hostname": os.environ.get("HOSTNAME", "unknown"),
-        "build_number": os.environ.get("BUILD_NUMBER", "unknown"),
-        "git_commit": os.environ.get("GIT_COMMIT", "unknown")
-    }
-    
     log_structured("INFO", "Build info requested")
-    return jsonify(build_data)
+    return BUILD_INFO.response()
 
 @app.route('/api/users', methods=['GET'])
 def get_users():
@@ -245,6 +328,10 @@ def unauthorized_access():
     log_structured("WARNING", "Unauthorized access attempt")
     return jsonify({"error": "Unauthorized access"}), 401
 
+startup_report["import_seconds"] = round(time.time() - PROCESS_STARTED_AT, 4)
+STARTUP_IMPORT_SECONDS.set(startup_report["import_seconds"])
+record_worker_ready()
+
 if __name__ == '__main__':
     log_structured("INFO", "Flask application starting", 
                    port=int(os.environ.get('PORT', 5000)))
@@ -0,0 +1,66 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Runs inside a fresh interpreter so every sample pays the full cold-start cost
+PROBE = '''
+import json, logging, time
+started = time.perf_counter()
+import app as flask_app
+module_import_seconds = time.perf_counter() - started
+logging.disable(logging.CRITICAL)
+flask_app.app.test_client().get("/health")
+print(json.dumps(dict(flask_app.startup_report, module_import_seconds=module_import_seconds)))
+'''
+
+def run_probe():
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def summarize(samples, key):
+    values = [s[key] for s in samples]
+    return {
+        "min": round(min(values), 4),
+        "median": round(statistics.median(values), 4),
+        "max": round(max(values), 4)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Flask app cold-start time")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-import-seconds", type=float,
+                        help="Exit non-zero if the median 'import app' time exceeds this budget")
+    parser.add_argument("--max-first-request-seconds", type=float,
+                        help="Exit non-zero if the median time to first request exceeds this budget")
+    args = parser.parse_args()
+
+    samples = [run_probe() for _ in range(args.runs)]
+    report = {
+        "runs": args.runs,
+        "module_import_seconds": summarize(samples, "module_import_seconds"),
+        "import_seconds": summarize(samples, "import_seconds"),
+        "ready_seconds": summarize(samples, "ready_seconds"),
+        "first_request_seconds": summarize(samples, "first_request_seconds")
+    }
+    print(json.dumps(report, indent=2))
+
+    failed = False
+    if args.max_import_seconds is not None and report["module_import_seconds"]["median"] > args.max_import_seconds:
+        print(f"Median import time exceeds budget of {args.max_import_seconds}s", file=sys.stderr)
+        failed = True
+    if args.max_first_request_seconds is not None and report["first_request_seconds"]["median"] > args.max_first_request_seconds:
+        print(f"Median time to first request exceeds budget of {args.max_first_request_seconds}s", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
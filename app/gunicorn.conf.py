@@ -0,0 +1,18 @@
+import gc
+
+# With --preload the app is imported once in the master and shared with the
+# workers copy-on-write. A GC pass writes to every object it visits, which
+# would copy those shared pages, so keep the collector off until the fork,
+# freeze what the master built, and turn it back on in each worker.
+gc.disable()
+
+def pre_fork(server, worker):
+    gc.freeze()
+
+def post_fork(server, worker):
+    gc.enable()
+
+def post_worker_init(worker):
+    # The worker has loaded the app and is about to accept connections
+    from app import record_worker_ready
+    record_worker_ready()
@@ -1,5 +1,6 @@
 import pytest
 import json
+import os
 from app import app
 
 @pytest.fixture
@@ -19,7 +20,7 @@ def test_health_endpoint(client):
     
     data = json.loads(response.data)
     assert data['status'] == 'healthy'
-    assert 'timestamp' in data
+    assert 'timestamp' not in data
     assert data['service'] == 'flask-app'
 
 def test_get_users(client):
@@ -99,7 +100,7 @@ def test_build_info_endpoint(client):
     
     data = json.loads(response.data)
     assert data['service'] == 'flask-app'
-    assert 'timestamp' in data
+    assert 'built_at' not in data
     assert 'build_info' in data
     assert 'environment' in data
     assert 'hostname' in data['environment']
@@ -260,3 +261,83 @@ def test_multiple_user_creation(client):
     # Ensure IDs are sequential
     for i in range(1, len(created_ids)):
         assert created_ids[i] == created_ids[i-1] + 1
+
+def test_startup_report(client):
+    from app import startup_report
+    assert startup_report['import_seconds'] > 0
+    assert startup_report['ready_seconds'] >= startup_report['import_seconds']
+
+    response = client.get('/health')
+    assert response.status_code == 200
+    assert startup_report['first_request_seconds'] >= startup_report['import_seconds']
+
+    response = client.get('/metrics')
+    assert b'flask_startup_import_seconds' in response.data
+    assert b'flask_startup_ready_seconds' in response.data
+    assert b'flask_startup_first_request_seconds' in response.data
+
+def test_startup_report_resets_in_forked_worker():
+    if not hasattr(os, 'fork'):
+        pytest.skip('os.fork is not available')
+    import app as flask_app
+    original = flask_app.startup_report['first_request_seconds']
+    flask_app.startup_report['first_request_seconds'] = 123.0
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        reset = (flask_app.startup_report['first_request_seconds'] is None
+                 and flask_app.startup_report['ready_seconds'] is None
+                 and flask_app.worker_started_at > flask_app.PROCESS_STARTED_AT)
+        os.write(write_fd, b'1' if reset else b'0')
+        os._exit(0)
+
+    os.close(write_fd)
+    result = os.read(read_fd, 1)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    parent_value = flask_app.startup_report['first_request_seconds']
+    flask_app.startup_report['first_request_seconds'] = original
+    assert result == b'1'
+    assert parent_value == 123.0
+
+def test_build_info_etag_not_modified(client):
+    response = client.get('/build-info')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert not etag.startswith('W/')
+
+    response = client.get('/build-info', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+def test_health_served_from_cache(client):
+    first = client.get('/health')
+    second = client.get('/health')
+    assert first.data == second.data
+    assert first.headers['ETag'] == second.headers['ETag']
+
+def test_health_payload_matches_jsonify(client):
+    from app import health_payload
+    from flask import jsonify
+    response = client.get('/health')
+    with app.app_context():
+        assert response.data == jsonify(health_payload()).get_data()
+
+def test_static_payload_reloads_on_mtime_change(tmp_path):
+    from app import StaticJSONPayload, read_build_info_file
+    build_file = tmp_path / 'build-info.txt'
+    build_file.write_text('Git Commit: abc123')
+    payload = StaticJSONPayload(lambda: {"build_info": read_build_info_file(str(build_file))},
+                                watch_path=str(build_file))
+
+    with app.test_request_context('/build-info'):
+        first = payload.response()
+        assert json.loads(first.data)['build_info'] == 'Git Commit: abc123'
+
+        build_file.write_text('Git Commit: def456')
+        os.utime(build_file, ns=(0, 0))
+        second = payload.response()
+        assert json.loads(second.data)['build_info'] == 'Git Commit: def456'
+        assert first.headers['ETag'] != second.headers['ETag']